@@ -1,14 +1,29 @@
 from datetime import datetime
 
+# Fallback formats for dates that aren't ISO 8601
+_DATE_FORMATS = (
+    "%d-%m-%Y %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%d-%m-%Y",
+)
+
 
 def parse_date(date_str: str) -> datetime:
-    """Parse a string to datetime using common formats."""
-    date_formats = [
-        "%d-%m-%Y %H:%M:%S",
-        "%Y-%m-%d %H:%M:%S",
-        "%d-%m-%Y",
-    ]
-    for date_format in date_formats:
+    """
+    Parse a string to naive datetime using common formats.
+    Besides the formats in _DATE_FORMATS, ISO 8601 forms such as "2024-01-02",
+    "2024-01-02T10:11:12" and "20240102" are accepted. Values with a UTC offset
+    are rejected, so results can always be compared with each other.
+    """
+    # ISO 8601 is parsed in C and much faster than strptime
+    try:
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    else:
+        if parsed.tzinfo is None:
+            return parsed
+    for date_format in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, date_format)
         except ValueError:
@@ -3,15 +3,46 @@ import locale
 from datetime import datetime
 from . import parse_date
 
+# Numeric locales that use "." as decimal point and no thousands separator
+_C_LOCALES = ("C", "POSIX", "C.UTF-8", "C.utf8")
+
+
+def _float_parser() -> Callable[[str], float]:
+    """
+    Returns float under the C locale, where it gives the same result as
+    locale.atof but faster, and locale.atof otherwise. Resolved on each use,
+    so a locale set by the application after import is respected.
+    """
+    if locale.setlocale(locale.LC_NUMERIC) in _C_LOCALES:
+        return float
+    return locale.atof
+
+
+def _to_float(x: str) -> float:
+    """Float"""
+    return _float_parser()(x)
+
+
+def _to_int_list(x: str) -> list[int]:
+    """Integer list"""
+    return [int(val) for val in x.split(",")]
+
+
+def _to_float_list(x: str) -> list[float]:
+    """Float list"""
+    atof = _float_parser()
+    return [atof(val) for val in x.split(",")]
+
+
 # Type mapping functions
 TYPE_MAPPERS: dict[int, Callable[[str], Any]] = {
     1: str,  # String
     2: int,  # Integer
-    3: locale.atof,  # Float
+    3: _to_float,  # Float
     4: lambda x: x.lower() in ("y", "yes", "t", "true", "on", "1", "ja"),  # Boolean
     5: lambda x: x.split(","),  # String list
-    6: lambda x: [int(val) for val in x.split(",")],  # Integer list
-    7: lambda x: [locale.atof(val) for val in x.split(",")],  # Float list
+    6: _to_int_list,  # Integer list
+    7: _to_float_list,  # Float list
     8: parse_date,  # Date
 }
 
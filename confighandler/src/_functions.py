@@ -1,14 +1,35 @@
 """Database configuration and connection utilities for PostgreSQL."""
 
+import atexit
+import os
+import threading
+import time
 from configparser import ConfigParser
+from functools import lru_cache
 from typing import Any, LiteralString
 from datetime import datetime
 from pydantic import BaseModel, model_validator, Field, ConfigDict, StrictBool
 import psycopg
 import psycopg.sql as sql
-from psycopg.rows import dict_row, DictRow
+from psycopg.rows import dict_row, tuple_row, DictRow, RowFactory
+from psycopg_pool import ConnectionPool
+from ._constants import TYPE_MAPPERS
 from ._models import Row
 
+# Connection pools, one per ini file, created lazily on first use and stored
+# with the connection values they were created from
+_POOLS: dict[str, tuple[dict[str, Any], ConnectionPool]] = {}
+_POOLS_LOCK = threading.Lock()
+# Seconds to wait for a free connection before raising PoolTimeout
+_POOL_TIMEOUT: float = 10.0
+
+# Parsed ini sections keyed by (filename, section), stored with the file mtime
+_INI_CACHE: dict[tuple[str, str], tuple[int, dict[str, Any]]] = {}
+
+# Unique app names per ini file, stored with the time they were fetched
+_APP_NAMES_TTL: float = 60.0
+_APP_NAMES_CACHE: dict[str, tuple[float, set[str]]] = {}
+
 
 def load_config(
     filename: str = "database.ini", section: str = "postgresql"
@@ -29,6 +50,16 @@ def load_config(
     **Raises:**
         **Exception**: Exception
     """
+    # Reuse the parsed section as long as the file is unchanged
+    try:
+        mtime = os.stat(filename).st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (filename, section)
+    hit = _INI_CACHE.get(key)
+    if hit is not None and hit[0] == mtime:
+        return dict(hit[1])
+
     try:
         parser = ConfigParser()
         parser.read(filename)
@@ -42,7 +73,9 @@ def load_config(
             params = parser.items(section)
             for param in params:
                 config[param[0]] = param[1]
-            return config
+            if mtime is not None:
+                _INI_CACHE[key] = (mtime, config)
+            return dict(config)
         else:
             raise RuntimeError(f"Section {section} not found in the {filename} file")
     except Exception as exc:
@@ -51,26 +84,83 @@ def load_config(
         ) from exc
 
 
-def connect(config: dict):
+def _get_pool(ini_file: str = "database.ini") -> ConnectionPool:
     """
     Purpose:
-    Connect to the PostgreSQL database server
+    Get the connection pool for an ini file, creating it on first use.
+    The pool is replaced when the connection values in the ini file change
 
     **Args:**
-        **config** (*dict*): Configuration dictionary
+        **ini_file** (*str*): File containing connection values
+                            default database.ini
 
     **Returns:**
-        **conn** (*psycopg.Connection*): Database connection
+        **pool** (*psycopg_pool.ConnectionPool*): Connection pool
+    """
+    config = load_config(filename=ini_file)
+    entry = _POOLS.get(ini_file)
+    if entry is not None and entry[0] == config:
+        return entry[1]
+
+    with _POOLS_LOCK:
+        entry = _POOLS.get(ini_file)
+        if entry is not None and entry[0] == config:
+            return entry[1]
+
+        # prepare_threshold=1 lets psycopg prepare a query server-side on
+        # its second execution, so repeated selects skip parse/plan
+        kwargs = {"prepare_threshold": 1, **config}
+        # Connect once up front, so an unreachable server or bad credentials
+        # raise psycopg's error straight away instead of a PoolTimeout
+        psycopg.connect(**kwargs).close()
+        pool = ConnectionPool(
+            kwargs=kwargs,
+            min_size=1,
+            max_size=10,
+            timeout=_POOL_TIMEOUT,
+            # the idle connection may have been dropped by the server
+            check=ConnectionPool.check_connection,
+            open=True,
+        )
+        _POOLS[ini_file] = (config, pool)
+
+    # The ini file changed, connections still in use are closed when returned
+    if entry is not None:
+        entry[1].close()
+    return pool
+
+
+@atexit.register
+def close_pools() -> None:
+    """
+    Purpose:
+    Close all connection pools and the connections they hold.
+    Runs automatically at exit, a new pool is created on the next connect()
+    """
+    with _POOLS_LOCK:
+        pools = [pool for _, pool in _POOLS.values()]
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def connect(ini_file: str = "database.ini"):
+    """
+    Purpose:
+    Borrow a connection to the PostgreSQL database server from the pool
+
+    **Args:**
+        **ini_file** (*str*): File containing connection values
+                            default database.ini
+
+    **Returns:**
+        **conn** (*contextmanager*): Context manager yielding a *psycopg.Connection*,
+                            the connection is returned to the pool on exit
 
     **Raises:**
         **error** (*psycopg.DatabaseError*): Database error
     """
-    try:
-        # connecting to the PostgreSQL server
-        conn = psycopg.connect(**config)
-        return conn
-    except (psycopg.DatabaseError, Exception) as error:
-        raise error
+    return _get_pool(ini_file).connection()
 
 
 def execute_query(
@@ -106,11 +196,40 @@ def fetch_query(
         return result
 
 
+@lru_cache(maxsize=64)
+def _build_select(
+    schema_name: str, table_name: str, columns: tuple[str, ...]
+) -> sql.Composed:
+    """
+    Compose "SELECT * FROM schema.table [WHERE col = %s AND ...]", cached so the
+    same table and WHERE columns reuse one composed query.
+
+    **Args:**
+        **schema_name** (*str*): The schema name of the table.
+        **table_name** (*str*): The name of the table to query.
+        **columns** (*tuple*): Columns to filter by, in parameter order.
+
+    **Returns:**
+        **query** (*sql.Composed*): The composed query.
+    """
+    query = sql.SQL("SELECT * FROM {schema}.{table}").format(
+        schema=sql.Identifier(schema_name), table=sql.Identifier(table_name)
+    )
+
+    # If there are conditions, build the WHERE clause
+    if columns:
+        conditions = [sql.SQL("{} = %s").format(sql.Identifier(k)) for k in columns]
+        query = query + sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
+    return query
+
+
 def select_with_conditions(
     conn: psycopg.Connection,
     schema_name: str,
     table_name: str,
     where_conditions: dict | None = None,
+    row_factory: RowFactory = dict_row,
+    binary: bool = True,
 ):
     """
     Select rows from a table with dynamic WHERE conditions.
@@ -120,30 +239,21 @@ def select_with_conditions(
         **schema_name** (*str*): The schema name of the table.
         **table_name** (*str*): The name of the table to query.
         **where_conditions** (*dict*): A dictionary of columns and their values to filter by.
+        **row_factory** (*RowFactory*): Row factory for the cursor, default dict_row.
+                            Use tuple_row when column names aren't needed
+        **binary** (*bool*): Fetch results in binary format, default True.
+                            Set to False for columns of types without a binary loader
 
     **Returns:**
-        **list** (*list*): A list of dictionaries representing the rows that match the conditions.
+        **list** (*list*): A list of rows (dictionaries by default) that match the conditions.
     """
     try:
-        with conn.cursor(row_factory=dict_row) as cursor:
-            # Start building the query
-            query = sql.SQL("SELECT * FROM {schema}.{table}").format(
-                schema=sql.Identifier(schema_name), table=sql.Identifier(table_name)
-            )
-
-            # If there are conditions, build the WHERE clause
+        with conn.cursor(row_factory=row_factory, binary=binary) as cursor:
             if where_conditions:
-                conditions = [
-                    sql.SQL("{} = %s").format(sql.Identifier(k))
-                    for k in where_conditions.keys()
-                ]
-
-                query = query + sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
-
-                # Execute the query
+                query = _build_select(schema_name, table_name, tuple(where_conditions))
                 cursor.execute(query, list(where_conditions.values()))
             else:
-                cursor.execute(query)
+                cursor.execute(_build_select(schema_name, table_name, ()))
 
             # Fetch all the rows
             rows = cursor.fetchall()
@@ -153,6 +263,31 @@ def select_with_conditions(
         raise error
 
 
+def _fetch_distinct_ids(
+    conn: psycopg.Connection, schema_name: str, table_name: str, column: str
+) -> set:
+    """
+    Select the distinct values of a single column.
+
+    **Args:**
+        **conn** (*psycopg.Connection*): The database connection object.
+        **schema_name** (*str*): The schema name of the table.
+        **table_name** (*str*): The name of the table to query.
+        **column** (*str*): The column to fetch distinct values from.
+
+    **Returns:**
+        **set** (*set*): The distinct values of the column.
+    """
+    query = sql.SQL("SELECT DISTINCT {column} FROM {schema}.{table}").format(
+        column=sql.Identifier(column),
+        schema=sql.Identifier(schema_name),
+        table=sql.Identifier(table_name),
+    )
+    with conn.cursor(row_factory=tuple_row) as cursor:
+        cursor.execute(query)
+        return {row[0] for row in cursor.fetchall()}
+
+
 class Parameter:
     """
     Purpose:
@@ -179,9 +314,7 @@ def get_initial_values(appname: str = "", debugging: bool = False):
     """
 
     if appname is not None and len(appname) > 0:
-        config = load_config()
-        connection = connect(config)
-        if connection:
+        with connect() as connection:
             parameters = []
             #   Select the values from the database
             where_conditions = {"id": appname, "debugmode": debugging}
@@ -198,19 +331,47 @@ def get_initial_values(appname: str = "", debugging: bool = False):
 
 def get_unique_app_names(ini_file: str = "database.ini") -> set[str]:
     """
-    Get all unique app names from the database
+    Get all unique app names from the database.
+    Results are cached per ini file for a short while (see _APP_NAMES_TTL)
 
     Returns:
         set[str]: A set of all unique app names
     """
-    config = load_config(filename=ini_file)
-    connection = connect(config)
-    if connection:
+    now = time.monotonic()
+    hit = _APP_NAMES_CACHE.get(ini_file)
+    if hit is not None and now - hit[0] < _APP_NAMES_TTL:
+        return set(hit[1])
+
+    with connect(ini_file) as connection:
         #   Select the values from the database
-        results = select_with_conditions(connection, "public", "nkinitvalues")
-        return set([result["id"] for result in results])
-    else:
-        raise ConnectionError("Failed to connect to the database")
+        app_names = _fetch_distinct_ids(connection, "public", "nkinitvalues", "id")
+    _APP_NAMES_CACHE[ini_file] = (now, app_names)
+    return set(app_names)
+
+
+def _convert_value(
+    row: dict,
+) -> str | int | float | bool | list[str] | list[int] | list[float] | datetime:
+    """
+    Convert the raw value of a row to its type without building a Row model
+
+    **Args:**
+        **row** (*DictRow | dict*): Database record with type_id and value
+
+    **Returns:**
+        The typed value based on type_id
+    """
+    try:
+        mapper = TYPE_MAPPERS[row["type_id"]]
+    except KeyError:
+        raise ValueError("Incompatibile type is given") from None
+
+    try:
+        return mapper(row["value"])
+    except (ValueError, TypeError) as e:
+        raise ValueError(
+            f"Failed to convert value '{row['value']}' with type_id {row['type_id']}: {e}"
+        ) from e
 
 
 def get_parameter(row: DictRow) -> Parameter:
@@ -228,7 +389,7 @@ def get_parameter(row: DictRow) -> Parameter:
 
     try:
         # Create Pydantic model with automatic type conversion
-        row_model = Row.model_validate(dict(row))
+        row_model = Row(row=row)
         return Parameter(name=row_model.name, value=row_model.value)
     except Exception as e:
         raise e
@@ -251,21 +412,57 @@ def get_config(
     if appname is not None and len(appname) > 0:
         # print(f'looking up valujes for {appname}')
         constants = {}
-        config = load_config(filename=ini_file)
-        connection = connect(config)
-        with connection:
+        with connect(ini_file) as connection:
             # print(f'connection established')
             #   Select the values from the database
             where_conditions = {"id": appname, "debugmode": debugging}
             rows = select_with_conditions(
                 connection, "public", "nkinitvalues", where_conditions
             )
+        convert = _convert_value
+        try:
             for row in rows:
-                constants[row["name"]] = get_parameter_value(row)
-            return constants
+                constants[row["name"]] = convert(row)
+        except Exception as e:
+            raise RuntimeError(f"Value conversion failed: {e}") from e
+        return constants
     return {}
 
 
+def get_configs(
+    appnames: list[str], debugging: bool = False, ini_file: str = "database.ini"
+) -> dict[str, dict]:
+    """
+    Purpose:
+    Get constants for several applications with a single query
+
+    Argument:
+    appnames -->  names of applications (id in table row)
+    debugging --> indicates whether values fetched are for production or debugging.   Default is False
+
+    returns a dictionary per appname containing name and value of constants/parameters
+    """
+    configs: dict[str, dict] = {appname: {} for appname in appnames}
+    if not configs:
+        return configs
+
+    with connect(ini_file) as connection:
+        with connection.cursor(row_factory=dict_row, binary=True) as cursor:
+            cursor.execute(
+                "SELECT id, name, type_id, value FROM public.nkinitvalues"
+                " WHERE id = ANY(%s) AND debugmode = %s",
+                (list(configs), debugging),
+            )
+            rows = cursor.fetchall()
+    convert = _convert_value
+    try:
+        for row in rows:
+            configs[row["id"]][row["name"]] = convert(row)
+    except Exception as e:
+        raise RuntimeError(f"Value conversion failed: {e}") from e
+    return configs
+
+
 def get_parameter_value(
     row: dict,
 ) -> str | int | float | bool | list[str] | list[int] | list[float] | datetime | None:
@@ -282,14 +479,39 @@ def get_parameter_value(
         return None
 
     try:
-        # Handle both DictRow and dict types
-        row_data = dict(row)
-        row_model = Row(row=row_data)
-        return row_model.value
+        return _convert_value(row)
     except Exception as e:
         raise RuntimeError(f"Value conversion failed: {e}") from e
 
 
+def validate_config_args(appname: str, debugging: bool, ini_file: str) -> None:
+    """
+    Evaluating input values to the Configuration-class without building a model
+
+    **Args:**
+        **appname** (*str*): Name of application, must be a known app_name
+        **debugging** (*bool*): Production or debugging values
+        **ini_file** (*str*): File containing connection values
+
+    **Raises:**
+        **TypeError**: An argument has the wrong type
+        **ValueError**: The app_name is too short or unknown
+    """
+    if not isinstance(appname, str):
+        raise TypeError("appname must be str")
+    if not isinstance(debugging, bool):
+        raise TypeError("debugging must be bool")
+    if not isinstance(ini_file, str):
+        raise TypeError("ini_file must be str")
+    if len(appname) < 5:
+        raise ValueError("app_name is too short (min 5 chars).")
+    allowed: set[str] = get_unique_app_names(ini_file)
+    if appname not in allowed:
+        raise ValueError(
+            f"Invalid app_name '{appname}'. Must be one of: {sorted(allowed)}"
+        )
+
+
 class ConfigurationModel(BaseModel):  # TODO: to be transferred to "_models"
     """
     Evaluating input values to the Configuration-class
@@ -305,12 +527,5 @@ class ConfigurationModel(BaseModel):  # TODO: to be transferred to "_models"
         """
         Validating if the app_name is a valid unique app_name
         """
-        # Check minimum length first
-        if len(self.appname) < 5:
-            raise ValueError("app_name is too short (min 5 chars).")
-        allowed: set[str] = get_unique_app_names(self.ini_file)
-        if self.appname not in allowed:
-            raise ValueError(
-                f"Invalid app_name '{self.appname}'. Must be one of: {sorted(allowed)}"
-            )
+        validate_config_args(self.appname, self.debugging, self.ini_file)
         return self
@@ -21,8 +21,9 @@ class Row(BaseModel):
     @classmethod
     def all_columns_present(cls, v:dict):
         """Valuates if all columns are present in the row"""
-        diff = EXPECTED_COLUMNS - set(v.keys())
-        assert len(diff) == 0, f'Column {diff}'
+        for column in EXPECTED_COLUMNS:
+            if column not in v:
+                raise ValueError(f"Missing column {column}")
         return v
 
     @computed_field
@@ -57,13 +58,16 @@ class Row(BaseModel):
             The converted value with the appropriate type
         """
 
-        mapper = TYPE_MAPPERS.get(self.row["type_id"])
+        row = self.row
+        type_id = row["type_id"]
+        raw_value = row["value"]
+        mapper = TYPE_MAPPERS.get(type_id)
         if mapper is None:
             raise ValueError("Incompatibile type is given")
 
         try:
-            return mapper(self.row["value"])
+            return mapper(raw_value)
         except (ValueError, TypeError) as e:
             raise ValueError(
-                f"Failed to convert value '{self.row['value']}' with type_id {self.row['type_id']}: {e}"
+                f"Failed to convert value '{raw_value}' with type_id {type_id}: {e}"
             ) from e
@@ -1,5 +1,17 @@
+import copy
+from functools import lru_cache
 from typing import Any
-from ._functions import get_config, ConfigurationModel
+from ._functions import get_config, validate_config_args, _APP_NAMES_CACHE
+
+
+@lru_cache(maxsize=32, typed=True)
+def _load_configs(appname: str, debugging: bool, ini_file: str) -> dict:
+    """
+    Validates the input and fetches the config-values, cached per
+    (appname, debugging, ini_file). Failed validations are not cached.
+    """
+    validate_config_args(appname, debugging, ini_file)
+    return get_config(appname=appname, debugging=debugging, ini_file=ini_file)
 
 
 class Configuration:
@@ -19,16 +31,32 @@ class Configuration:
         self.named_attributes = named_attributes
         self.initialized = True
         self.ini_file = ini_file
-        self.validation_model = ConfigurationModel(
-            appname=appname, debugging=debugging, ini_file=self.ini_file
-        )
-        self.configs: dict = get_config(
-            appname=appname, debugging=debugging, ini_file=self.ini_file
+        # Deep copy, list values would otherwise be shared with the cache
+        self.configs: dict = copy.deepcopy(
+            _load_configs(appname, debugging, self.ini_file)
         )
+        # Store config-values as instance attributes for direct attribute access,
+        # keys that aren't identifiers or would shadow attributes go via __getattr__
+        for key, value in self.configs.items():
+            if (
+                key.isidentifier()
+                and key not in self.__dict__
+                and not hasattr(type(self), key)
+            ):
+                object.__setattr__(self, key, value)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """
+        Clears cached config-values, so the next instance reads from the database
+        """
+        _load_configs.cache_clear()
+        _APP_NAMES_CACHE.clear()
 
     def __getattr__(self, name: str) -> Any:
         """
-        Enables direct attribute access to config-values
+        Enables direct attribute access to config-values that couldn't be
+        stored as instance attributes
 
         **Args:**
             **name** (*str*): The name of the attribute
@@ -42,10 +70,14 @@ class Configuration:
         Returns list of valid attributes including config keys.
         Enables runtime attribute discovery and IDE autocompletion.
         """
-        # Combine standard attributes with config keys
-        standard_attrs = list(super().__dir__())
-        config_attrs = list(self.configs.keys())
-        return sorted(set(standard_attrs + config_attrs))
+        # Combine standard attributes with config keys, computed once per instance
+        cached = self.__dict__.get("_dir_cache")
+        if cached is None:
+            standard_attrs = list(super().__dir__())
+            config_attrs = list(self.configs.keys())
+            cached = sorted(set(standard_attrs + config_attrs))
+            self.__dict__["_dir_cache"] = cached
+        return cached
 
     def __repr__(self) -> str:
         return f"Configuration(appname={self.appname},debugging={self.debugging},named_attributes={self.named_attributes},ini_file = {self.ini_file})"
@@ -0,0 +1,62 @@
+from unittest import TestCase
+from unittest.mock import patch
+from confighandler.src.configuration import Configuration
+
+
+class TestConfigAttributes(TestCase):
+    def setUp(self) -> None:
+        self.configs = {
+            "table_name": "edoc",
+            "appname": "shadowed",
+            "invalidate_cache": "shadowed",
+            "not-an-identifier": 42,
+        }
+        patcher = patch(
+            "confighandler.src.configuration._load_configs",
+            return_value=self.configs,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config = Configuration("nk-edoc-geocoding")
+
+    def test_stored_as_attribute(self) -> None:
+        """
+        Testing if config-values are stored directly on the instance
+        """
+        self.assertEqual(self.config.__dict__["table_name"], "edoc")
+        self.assertEqual(self.config.table_name, "edoc")
+
+    def test_no_shadowing(self) -> None:
+        """
+        Testing if config keys don't replace instance attributes or methods
+        """
+        self.assertEqual(self.config.appname, "nk-edoc-geocoding")
+        self.assertTrue(callable(self.config.invalidate_cache))
+        self.assertEqual(self.config.configs["appname"], "shadowed")
+
+    def test_non_identifier_key(self) -> None:
+        """
+        Testing if keys that aren't identifiers still resolve through __getattr__
+        """
+        self.assertNotIn("not-an-identifier", self.config.__dict__)
+        self.assertEqual(getattr(self.config, "not-an-identifier"), 42)
+        with self.assertRaises(AttributeError):
+            self.config.random_attr
+
+    def test_dir(self) -> None:
+        """
+        Testing if dir() lists config keys next to the standard attributes
+        """
+        attributes = dir(self.config)
+        for key in self.configs:
+            self.assertIn(key, attributes)
+        self.assertIn("invalidate_cache", attributes)
+        self.assertEqual(attributes, sorted(attributes))
+
+    def test_dir_cached(self) -> None:
+        """
+        Testing if the attribute list is built once and reused
+        """
+        first = self.config.__dir__()
+        self.assertIs(self.config.__dir__(), first)
+        self.assertIs(self.config.__dict__["_dir_cache"], first)
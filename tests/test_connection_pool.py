@@ -0,0 +1,54 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+import psycopg
+from confighandler.src._functions import _POOLS, _get_pool, get_unique_app_names
+
+
+class TestConnectionPool(TestCase):
+    def setUp(self) -> None:
+        # Nothing listens on port 1, so connecting is refused right away
+        handle, self.ini_file = tempfile.mkstemp(suffix=".ini")
+        os.close(handle)
+        self.addCleanup(os.remove, self.ini_file)
+        self.addCleanup(_POOLS.pop, self.ini_file, None)
+        self.write_ini("test")
+
+    def write_ini(self, user: str) -> None:
+        with open(self.ini_file, "w") as f:
+            f.write(
+                "[postgresql]\n"
+                "host=127.0.0.1\n"
+                "port=1\n"
+                "dbname=test\n"
+                f"user={user}\n"
+                "password=test\n"
+            )
+
+    def test_unreachable_server(self) -> None:
+        """
+        Testing if an unreachable server raises psycopg's error without creating a pool
+        """
+        with self.assertRaises(psycopg.OperationalError):
+            get_unique_app_names(self.ini_file)
+        self.assertNotIn(self.ini_file, _POOLS)
+
+    @patch("confighandler.src._functions.ConnectionPool")
+    @patch("psycopg.connect")
+    def test_pool_follows_ini_file(self, _connect, pool_class) -> None:
+        """
+        Testing if the pool is reused, and replaced when the ini file changes
+        """
+        first = _get_pool(self.ini_file)
+        self.assertIs(_get_pool(self.ini_file), first)
+        self.assertEqual(pool_class.call_count, 1)
+
+        mtime = os.stat(self.ini_file).st_mtime_ns
+        self.write_ini("other")
+        os.utime(self.ini_file, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+        _get_pool(self.ini_file)
+
+        self.assertEqual(pool_class.call_count, 2)
+        self.assertEqual(pool_class.call_args.kwargs["kwargs"]["user"], "other")
+        first.close.assert_called_once()
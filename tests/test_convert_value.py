@@ -0,0 +1,103 @@
+import locale
+from unittest import TestCase
+from unittest.mock import patch
+from datetime import datetime
+from confighandler.src import parse_date
+from confighandler.src._constants import TYPE_MAPPERS
+from confighandler.src._functions import _convert_value, get_parameter_value
+
+
+class TestConvertValue(TestCase):
+    def setUp(self) -> None:
+        self.int_row = {
+            'id':'temp',
+            'name':'name1',
+            'description':'desc1',
+            'type_id': 2,
+            'value':"42",
+            'debugmode': False
+        }
+        self.list_row = dict(self.int_row, type_id=6, value="1,2,3")
+        self.unknown_type = dict(self.int_row, type_id=99)
+        self.bad_value = dict(self.int_row, value="not a number")
+
+    def test_converts_value(self) -> None:
+        """
+        Testing if the raw value is mapped to the type given by type_id
+        """
+        self.assertEqual(_convert_value(self.int_row), 42)
+        self.assertEqual(_convert_value(self.list_row), [1, 2, 3])
+
+    def test_unknown_type(self) -> None:
+        """
+        Testing if an unknown type_id raises an error
+        """
+        with self.assertRaises(ValueError):
+            _convert_value(self.unknown_type)
+
+    def test_bad_value(self) -> None:
+        """
+        Testing if a value that can't be converted raises an error
+        """
+        with self.assertRaises(ValueError):
+            _convert_value(self.bad_value)
+        with self.assertRaises(RuntimeError):
+            get_parameter_value(self.bad_value)
+
+    def test_date_formats(self) -> None:
+        """
+        Testing if both ISO and day-first dates are parsed
+        """
+        expected = datetime(2024, 1, 2, 10, 11, 12)
+        self.assertEqual(parse_date("2024-01-02 10:11:12"), expected)
+        self.assertEqual(parse_date("02-01-2024 10:11:12"), expected)
+        self.assertEqual(parse_date("02-01-2024"), datetime(2024, 1, 2))
+        with self.assertRaises(ValueError):
+            parse_date("02/01/2024")
+
+    def test_iso_date_formats(self) -> None:
+        """
+        Testing if other ISO forms are parsed, but values with a UTC offset are not
+        """
+        self.assertEqual(parse_date("2024-01-02"), datetime(2024, 1, 2))
+        self.assertEqual(parse_date("20240102"), datetime(2024, 1, 2))
+        self.assertEqual(
+            parse_date("2024-01-02T10:11:12"), datetime(2024, 1, 2, 10, 11, 12)
+        )
+        with self.assertRaises(ValueError):
+            parse_date("2024-01-02T10:11:12+02:00")
+        with self.assertRaises(ValueError):
+            parse_date("2024-01-02 10:11:12Z")
+
+    def test_float_c_locale(self) -> None:
+        """
+        Testing if floats use "." as decimal point under the C locale
+        """
+        self.assertEqual(_convert_value(dict(self.int_row, type_id=3, value="3.5")), 3.5)
+        self.assertEqual(TYPE_MAPPERS[7]("1.5,2"), [1.5, 2.0])
+
+    def test_float_comma_locale(self) -> None:
+        """
+        Testing if floats follow a "," decimal locale set after import
+        """
+        previous = locale.setlocale(locale.LC_NUMERIC)
+        for name in ("da_DK.UTF-8", "da_DK.utf8", "de_DE.UTF-8", "de_DE.utf8"):
+            try:
+                locale.setlocale(locale.LC_NUMERIC, name)
+                break
+            except locale.Error:
+                continue
+        else:
+            self.skipTest("no locale with \",\" as decimal point installed")
+        self.addCleanup(locale.setlocale, locale.LC_NUMERIC, previous)
+        self.assertEqual(TYPE_MAPPERS[3]("3,5"), 3.5)
+
+    @patch("locale.localeconv")
+    @patch("locale.setlocale", return_value="da_DK.UTF-8")
+    def test_float_comma_locale_mocked(self, _setlocale, localeconv) -> None:
+        """
+        Testing if locale.atof is used when the numeric locale isn't C
+        """
+        localeconv.return_value = {"decimal_point": ",", "thousands_sep": "."}
+        self.assertEqual(TYPE_MAPPERS[3]("3,5"), 3.5)
+        self.assertEqual(TYPE_MAPPERS[3]("1.000,5"), 1000.5)
@@ -0,0 +1,28 @@
+from unittest import TestCase
+from confighandler.src._functions import get_config, get_configs
+
+
+class TestGetConfigs(TestCase):
+    def setUp(self) -> None:
+        self.valid_app_name: str = "nk-edoc-geocoding"
+        self.invalid_app_name: str = "mit-mega-seje-program"
+        self.ini_file: str = "/Users/madsd/Desktop/git/_dev/database.ini"
+
+    def test_matches_get_config(self) -> None:
+        """
+        Testing if the batched lookup returns the same values as get_config
+        """
+        configs = get_configs(
+            [self.valid_app_name, self.invalid_app_name], ini_file=self.ini_file
+        )
+        self.assertEqual(
+            configs[self.valid_app_name],
+            get_config(self.valid_app_name, ini_file=self.ini_file),
+        )
+        self.assertEqual(configs[self.invalid_app_name], {})
+
+    def test_no_appnames(self) -> None:
+        """
+        Testing if an empty list returns an empty dict
+        """
+        self.assertEqual(get_configs([], ini_file=self.ini_file), {})
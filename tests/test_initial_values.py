@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 from pydantic import ValidationError
 from confighandler.src.configuration import Configuration
 from confighandler.src._functions import get_parameter, load_config
@@ -37,3 +38,27 @@ class TestConfiguration(TestCase):
             config = load_config("/Users/madsd/Desktop/git/_dev/database.ini")
             get_parameter(self.invalid_type)
 
+    @patch("confighandler.src.configuration.get_config")
+    @patch("confighandler.src.configuration.validate_config_args")
+    def test_cached_instances(self, validate, get_config):
+        """
+        Testing if repeated instances are served from the cache, each with its own values
+        """
+        Configuration.invalidate_cache()
+        self.addCleanup(Configuration.invalidate_cache)
+        get_config.return_value = {"hosts": ["a"], "port": 1}
+
+        first = Configuration(appname=self.valid_app_name, debugging=self.valid_debug)
+        second = Configuration(appname=self.valid_app_name, debugging=self.valid_debug)
+        validate.assert_called_once()
+        get_config.assert_called_once()
+        self.assertEqual(first.configs, second.configs)
+        self.assertIsNot(first.configs, second.configs)
+
+        # list values must not be shared between instances
+        first.hosts.append("evil")
+        third = Configuration(appname=self.valid_app_name, debugging=self.valid_debug)
+        self.assertEqual(second.hosts, ["a"])
+        self.assertEqual(third.hosts, ["a"])
+        get_config.assert_called_once()
+
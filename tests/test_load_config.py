@@ -0,0 +1,51 @@
+import os
+import tempfile
+from unittest import TestCase
+from confighandler.src._functions import load_config
+
+
+class TestLoadConfig(TestCase):
+    def setUp(self) -> None:
+        handle, self.ini_file = tempfile.mkstemp(suffix=".ini")
+        os.close(handle)
+        self.addCleanup(os.remove, self.ini_file)
+        self.write_ini("localhost")
+
+    def write_ini(self, host: str) -> None:
+        with open(self.ini_file, "w") as f:
+            f.write(f"[postgresql]\nhost={host}\ndbname=test\n")
+
+    def test_reads_section(self) -> None:
+        """
+        Testing if the section is returned as a dictionary
+        """
+        self.assertEqual(
+            load_config(self.ini_file), {"host": "localhost", "dbname": "test"}
+        )
+
+    def test_returns_copy(self) -> None:
+        """
+        Testing if changing the returned dictionary doesn't change the cached values
+        """
+        load_config(self.ini_file)["host"] = "changed"
+        self.assertEqual(load_config(self.ini_file)["host"], "localhost")
+
+    def test_rereads_changed_file(self) -> None:
+        """
+        Testing if an edited file is parsed again
+        """
+        load_config(self.ini_file)
+        mtime = os.stat(self.ini_file).st_mtime_ns
+        self.write_ini("otherhost")
+        # make sure the mtime differs, even on filesystems with coarse timestamps
+        os.utime(self.ini_file, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+        self.assertEqual(load_config(self.ini_file)["host"], "otherhost")
+
+    def test_missing_section(self) -> None:
+        """
+        Testing if a missing section or file raises an error
+        """
+        with self.assertRaises(RuntimeError):
+            load_config(self.ini_file, section="missing")
+        with self.assertRaises(RuntimeError):
+            load_config(self.ini_file + ".missing")
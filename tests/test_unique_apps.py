@@ -1,6 +1,10 @@
 from unittest import TestCase
 from pydantic import ValidationError
-from confighandler.src._functions import ConfigurationModel, get_unique_app_names
+from confighandler.src._functions import (
+    ConfigurationModel,
+    get_unique_app_names,
+    validate_config_args,
+)
 
 
 
@@ -79,3 +83,22 @@ class TestUniqueApps(TestCase):
 
         with self.assertRaises(ValidationError):
             ConfigurationModel(appname="testApp", debugging=True, ini_file=1)
+
+    def test_validate_config_args(self) -> None:
+        """
+        Testing if the plain validation accepts and rejects the same input as the model
+        """
+        ini_file = "/Users/madsd/Desktop/git/_dev/database.ini"
+        validate_config_args(self.valid_app_name, self.valid_debug, ini_file)
+
+        with self.assertRaises(ValueError):
+            validate_config_args(self.invalid_app_name, False, ini_file)
+
+        with self.assertRaises(ValueError):
+            validate_config_args(self.too_short, False, ini_file)
+
+        with self.assertRaises(TypeError):
+            validate_config_args(self.valid_app_name, self.invalid_debug, ini_file)
+
+        with self.assertRaises(TypeError):
+            validate_config_args(1, True, ini_file)